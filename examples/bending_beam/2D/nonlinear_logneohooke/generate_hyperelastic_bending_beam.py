@@ -1,5 +1,3 @@
-from cubitpy import CubitPy, cupy
-
 from femref.cubit_utils import print_mesh_statistics
 from femref.utils import write_readme
 
@@ -23,8 +21,6 @@ HEIGHT = 2  # [m]
 # integer indicating the mesh granularity, ranging from 1 (finest) to 10
 # (coarsest)
 MESH_SIZE = 0.1  # [m]
-# tolerance for identifying BCs based on point coordinates
-EPS = 1e-5
 
 ##### MODEL ###################################################################
 # kinematics (relation between strains and displacements)
@@ -86,6 +82,80 @@ OPTIONS = {
     },
 }
 
+"""Dictionary with the sections of the 4C input file."""
+INPUT_SECTIONS = {
+    "PROBLEM SIZE": {"DIM": 2},
+    "PROBLEM TYPE": {"PROBLEMTYPE": "Structure"},
+    "IO": {
+        "OUTPUT_BIN": False,
+        "STRUCT_DISP": True,
+        "FILESTEPS": 1000,
+        "VERBOSITY": "Standard",
+        "STRUCT_STRAIN": "gl",
+        "STRUCT_STRESS": "cauchy",
+        "OUTPUT_SPRING": True,
+        "WRITE_INITIAL_STATE": True,
+    },
+    "IO/RUNTIME VTK OUTPUT": {
+        "OUTPUT_DATA_FORMAT": "binary",
+        "INTERVAL_STEPS": LOAD_STEPS / 10.0,
+        "EVERY_ITERATION": False,
+    },
+    "IO/RUNTIME VTK OUTPUT/STRUCTURE": {
+        "OUTPUT_STRUCTURE": True,
+        "DISPLACEMENT": True,
+        "ELEMENT_OWNER": True,
+        "STRESS_STRAIN": True,
+    },
+    "STRUCTURAL DYNAMIC": {
+        "INT_STRATEGY": "Standard",
+        "DYNAMICTYPE": "Statics",
+        "RESULTSEVERY": 1,
+        "RESTARTEVERY": 1,
+        "TIMESTEP": 1.0 / LOAD_STEPS,
+        "NUMSTEP": LOAD_STEPS,
+        "MAXTIME": 1,
+        "PREDICT": "TangDis",  # try "ConstDis"
+        "NORM_RESF": "Rel",
+        "TOLDISP": 1e-7,
+        "TOLRES": 1e-7,
+        "NORMCOMBI_DISPPRES": "And",  # maybe without this?
+        "LINEAR_SOLVER": 1,
+        "NLNSOL": "fullnewton",
+        "MAXITER": 50,  # or are 20 sufficient?
+    },
+    "SOLVER 1": {
+        "NAME": "Structure_Solver",
+        "SOLVER": "Superlu",
+    },
+    "STRUCT NOX/Printing": {
+        "Outer Iteration": True,
+        "Inner Iteration": False,
+        "Outer Iteration StatusTest": True,
+    },
+    "MATERIALS": [
+        {
+            "MAT": 1,
+            "MAT_ElastHyper": {
+                "NUMMAT": 1,
+                "MATIDS": 10,
+                "DENS": 0.1,
+            },
+        },
+        {
+            "MAT": 10,
+            "ELAST_CoupLogNeoHooke": {
+                "MODE": "Lame",
+                "C1": MUE,
+                "C2": LAMBDA,
+            },
+        },
+    ],
+    "FUNCT1": [
+        {"SYMBOLIC_FUNCTION_OF_SPACE_TIME": "t"},
+    ],
+}
+
 
 ##########
 # SCRIPT #
@@ -95,6 +165,10 @@ OPTIONS = {
 def generate_bending_beam(filename: str) -> None:
     """ """
 
+    # import CubitPy only when it is actually needed, as loading the Cubit
+    # library is expensive
+    from cubitpy import CubitPy, cupy
+
     cubit = CubitPy()
 
     # create a rectangle with specified width and height
@@ -104,6 +178,13 @@ def generate_bending_beam(filename: str) -> None:
 
     # retrieve the id of the beam that was just added
     beam = cubit.surface(cubit.get_last_id(cupy.geometry.surface))
+    # the curves of a rectangle are numbered in a fixed order (top, left,
+    # bottom, right), i.e., the last one is the right edge and the others
+    # precede it
+    right_curve = cubit.get_last_id(cupy.geometry.curve)
+    bottom_curve = right_curve - 1
+    left_curve = right_curve - 2
+    top_curve = right_curve - 3
 
     if SHOW_STEP[0]:
         cubit.display_in_cubit()
@@ -117,7 +198,7 @@ def generate_bending_beam(filename: str) -> None:
 
     # add the boundary conditions
     cubit.add_node_set(
-        cubit.group(add_value=f"add curve with y_coord < {-HEIGHT / 2 + EPS}"),
+        cubit.group(add_value=f"add curve {bottom_curve}"),
         name="bottom",
         bc_type=cupy.bc_type.dirichlet,
         bc_description={
@@ -128,7 +209,7 @@ def generate_bending_beam(filename: str) -> None:
         },
     )
     cubit.add_node_set(
-        cubit.group(add_value=f"add curve with x_coord < {-LENGTH / 2 + EPS}"),
+        cubit.group(add_value=f"add curve {left_curve}"),
         name="left",
         bc_type=cupy.bc_type.dirichlet,
         bc_description={
@@ -139,7 +220,7 @@ def generate_bending_beam(filename: str) -> None:
         },
     )
     cubit.add_node_set(
-        cubit.group(add_value=f"add curve with y_coord > {HEIGHT / 2 - EPS}"),
+        cubit.group(add_value=f"add curve {top_curve}"),
         name="top",
         bc_type=cupy.bc_type.dirichlet,
         bc_description={
@@ -150,7 +231,7 @@ def generate_bending_beam(filename: str) -> None:
         },
     )
     cubit.add_node_set(
-        cubit.group(add_value=f"add curve with x_coord > {LENGTH / 2 - EPS}"),
+        cubit.group(add_value=f"add curve {right_curve}"),
         name="right",
         bc_type=cupy.bc_type.neumann,
         bc_description={
@@ -181,78 +262,7 @@ def generate_bending_beam(filename: str) -> None:
         cubit.display_in_cubit(labels=[cupy.geometry.curve])
 
     # Set the head string.
-    cubit.fourc_input.combine_sections({
-        "PROBLEM SIZE": {"DIM": 2},
-        "PROBLEM TYPE": {"PROBLEMTYPE": "Structure"},
-        "IO": {
-            "OUTPUT_BIN": False,
-            "STRUCT_DISP": True,
-            "FILESTEPS": 1000,
-            "VERBOSITY": "Standard",
-            "STRUCT_STRAIN": "gl",
-            "STRUCT_STRESS": "cauchy",
-            "OUTPUT_SPRING": True,
-            "WRITE_INITIAL_STATE": True,
-        },
-        "IO/RUNTIME VTK OUTPUT": {
-            "OUTPUT_DATA_FORMAT": "binary",
-            "INTERVAL_STEPS": LOAD_STEPS / 10.0,
-            "EVERY_ITERATION": False,
-        },
-        "IO/RUNTIME VTK OUTPUT/STRUCTURE": {
-            "OUTPUT_STRUCTURE": True,
-            "DISPLACEMENT": True,
-            "ELEMENT_OWNER": True,
-            "STRESS_STRAIN": True,
-        },
-        "STRUCTURAL DYNAMIC": {
-            "INT_STRATEGY": "Standard",
-            "DYNAMICTYPE": "Statics",
-            "RESULTSEVERY": 1,
-            "RESTARTEVERY": 1,
-            "TIMESTEP": 1.0 / LOAD_STEPS,
-            "NUMSTEP": LOAD_STEPS,
-            "MAXTIME": 1,
-            "PREDICT": "TangDis",  # try "ConstDis"
-            "NORM_RESF": "Rel",
-            "TOLDISP": 1e-7,
-            "TOLRES": 1e-7,
-            "NORMCOMBI_DISPPRES": "And",  # maybe without this?
-            "LINEAR_SOLVER": 1,
-            "NLNSOL": "fullnewton",
-            "MAXITER": 50,  # or are 20 sufficient?
-        },
-        "SOLVER 1": {
-            "NAME": "Structure_Solver",
-            "SOLVER": "Superlu",
-        },
-        "STRUCT NOX/Printing": {
-            "Outer Iteration": True,
-            "Inner Iteration": False,
-            "Outer Iteration StatusTest": True,
-        },
-        "MATERIALS": [
-            {
-                "MAT": 1,
-                "MAT_ElastHyper": {
-                    "NUMMAT": 1,
-                    "MATIDS": 10,
-                    "DENS": 0.1,
-                },
-            },
-            {
-                "MAT": 10,
-                "ELAST_CoupLogNeoHooke": {
-                    "MODE": "Lame",
-                    "C1": MUE,
-                    "C2": LAMBDA,
-                },
-            },
-        ],
-        "FUNCT1": [
-            {"SYMBOLIC_FUNCTION_OF_SPACE_TIME": "t"},
-        ],
-    })
+    cubit.fourc_input.combine_sections(INPUT_SECTIONS)
 
     # Write the input file.
     cubit.dump(filename)
@@ -1,5 +1,4 @@
 import os
-from cubitpy import CubitPy, cupy
 
 from femref.cubit_utils import print_mesh_statistics
 from femref.utils import write_readme
@@ -24,8 +23,6 @@ DEPTH = 1
 # integer indicating the mesh granularity, ranging from 1 (finest) to 10
 # (coarsest)
 MESH_SIZE = 0.1
-# tolerance for identifying BCs based on point coordinates
-EPS = 1e-5
 
 ##### MODEL ###################################################################
 # kinematics (relation between strains and displacements)
@@ -55,6 +52,9 @@ SHOW_FINAL = True
 # VARIABLES #
 #############
 
+# prescribed end rotation as a multiple of pi
+_TWIST = 2 * END_ROTATION / 360
+
 """Dictionary with options for the CubitPy instance."""
 OPTIONS = {
     "title": "Torsion of a block with non-linear kinematic behavior",
@@ -79,6 +79,87 @@ OPTIONS = {
     },
 }
 
+"""Dictionary with the sections of the 4C input file."""
+INPUT_SECTIONS = {
+    "PROBLEM SIZE": {"DIM": 3},
+    "PROBLEM TYPE": {"PROBLEMTYPE": "Structure"},
+    "IO": {
+        "OUTPUT_BIN": False,
+        "STRUCT_DISP": True,
+        "FILESTEPS": 1000,
+        "VERBOSITY": "Standard",
+        "STRUCT_STRAIN": "gl",
+        "STRUCT_STRESS": "cauchy",
+        "OUTPUT_SPRING": True,
+        "WRITE_INITIAL_STATE": True,
+    },
+    "IO/RUNTIME VTK OUTPUT": {
+        "OUTPUT_DATA_FORMAT": "binary",
+        "INTERVAL_STEPS": 5,
+        "EVERY_ITERATION": False,
+    },
+    "IO/RUNTIME VTK OUTPUT/STRUCTURE": {
+        "OUTPUT_STRUCTURE": True,
+        "DISPLACEMENT": True,
+        "ELEMENT_OWNER": True,
+        "STRESS_STRAIN": True,
+    },
+    "STRUCTURAL DYNAMIC": {
+        "INT_STRATEGY": "Standard",
+        "DYNAMICTYPE": "Statics",
+        "RESULTSEVERY": 5,
+        "RESTARTEVERY": LOAD_STEPS,
+        "TIMESTEP": 1.0 / LOAD_STEPS,
+        "NUMSTEP": LOAD_STEPS,
+        "MAXTIME": 1,
+        "PREDICT": "ConstDis",
+        "NORM_RESF": "Rel",
+        "TOLDISP": 1e-7,
+        "TOLRES": 1e-7,
+        "NORMCOMBI_DISPPRES": "And",
+        "LINEAR_SOLVER": 1,
+        "NLNSOL": "fullnewton",
+        "MAXITER": 20,
+    },
+    "SOLVER 1": {
+        "NAME": "Structure_Solver",
+        "SOLVER": "Superlu",
+    },
+    "STRUCT NOX/Printing": {
+        "Outer Iteration": True,
+        "Inner Iteration": False,
+        "Outer Iteration StatusTest": True,
+    },
+    "MATERIALS": [
+        {
+            "MAT": 1,
+            "MAT_ElastHyper": {
+                "NUMMAT": 1,
+                "MATIDS": 10,
+                "DENS": 1,
+            },
+        },
+        {
+            "MAT": 10,
+            "ELAST_CoupLogNeoHooke": {
+                "MODE": "YN",
+                "C1": YOUNG,
+                "C2": POISSON,
+            },
+        },
+    ],
+    "FUNCT1": [
+        {
+            "SYMBOLIC_FUNCTION_OF_SPACE_TIME": f"y*cos({_TWIST}*pi*t)-z*sin({_TWIST}*pi*t)-y"
+        },
+    ],
+    "FUNCT2": [
+        {
+            "SYMBOLIC_FUNCTION_OF_SPACE_TIME": f"y*sin({_TWIST}*pi*t)+z*cos({_TWIST}*pi*t)-z"
+        },
+    ],
+}
+
 
 ##########
 # SCRIPT #
@@ -88,13 +169,22 @@ OPTIONS = {
 def generate_block(filename: str) -> None:
     """ """
 
+    # import CubitPy only when it is actually needed, as loading the Cubit
+    # library is expensive
+    from cubitpy import CubitPy, cupy
+
     cubit = CubitPy()
 
-    # create a rectangle with specified width and height
+    # create a brick with specified length, height and depth
     cubit.cmd(f"brick x {LENGTH} y {HEIGHT} z {DEPTH}")
 
     # retrieve the id of the block that was just added
     block = cubit.volume(cubit.get_last_id(cupy.geometry.volume))
+    # the surfaces of a brick are numbered in a fixed order (+z, -z, -y, -x,
+    # +y, +x), i.e., the last one is the +x face and the -x face comes two
+    # surfaces before it
+    right_surface = cubit.get_last_id(cupy.geometry.surface)
+    left_surface = right_surface - 2
 
     if SHOW_STEP[0]:
         cubit.display_in_cubit()
@@ -116,7 +206,7 @@ def generate_block(filename: str) -> None:
 
     # add the boundary conditions
     cubit.add_node_set(
-        cubit.group(add_value=f"add surface with x_coord < {EPS}"),
+        cubit.group(add_value=f"add surface {left_surface}"),
         name="rigid_left",
         bc_type=cupy.bc_type.dirichlet,
         bc_description={
@@ -127,7 +217,7 @@ def generate_block(filename: str) -> None:
         },
     )
     cubit.add_node_set(
-        cubit.group(add_value=f"add surface with x_coord > {LENGTH - EPS}"),
+        cubit.group(add_value=f"add surface {right_surface}"),
         name="torsion_right",
         bc_type=cupy.bc_type.dirichlet,
         bc_description={
@@ -154,85 +244,7 @@ def generate_block(filename: str) -> None:
         cubit.display_in_cubit(labels=[cupy.geometry.surface])
 
     # Set the head string.
-    cubit.fourc_input.combine_sections({
-        "PROBLEM SIZE": {"DIM": 3},
-        "PROBLEM TYPE": {"PROBLEMTYPE": "Structure"},
-        "IO": {
-            "OUTPUT_BIN": False,
-            "STRUCT_DISP": True,
-            "FILESTEPS": 1000,
-            "VERBOSITY": "Standard",
-            "STRUCT_STRAIN": "gl",
-            "STRUCT_STRESS": "cauchy",
-            "OUTPUT_SPRING": True,
-            "WRITE_INITIAL_STATE": True,
-        },
-        "IO/RUNTIME VTK OUTPUT": {
-            "OUTPUT_DATA_FORMAT": "binary",
-            "INTERVAL_STEPS": 5,
-            "EVERY_ITERATION": False,
-        },
-        "IO/RUNTIME VTK OUTPUT/STRUCTURE": {
-            "OUTPUT_STRUCTURE": True,
-            "DISPLACEMENT": True,
-            "ELEMENT_OWNER": True,
-            "STRESS_STRAIN": True,
-        },
-        "STRUCTURAL DYNAMIC": {
-            "INT_STRATEGY": "Standard",
-            "DYNAMICTYPE": "Statics",
-            "RESULTSEVERY": 5,
-            "RESTARTEVERY": LOAD_STEPS,
-            "TIMESTEP": 1.0 / LOAD_STEPS,
-            "NUMSTEP": LOAD_STEPS,
-            "MAXTIME": 1,
-            "PREDICT": "ConstDis",
-            "NORM_RESF": "Rel",
-            "TOLDISP": 1e-7,
-            "TOLRES": 1e-7,
-            "NORMCOMBI_DISPPRES": "And",
-            "LINEAR_SOLVER": 1,
-            "NLNSOL": "fullnewton",
-            "MAXITER": 20,
-        },
-        "SOLVER 1": {
-            "NAME": "Structure_Solver",
-            "SOLVER": "Superlu",
-        },
-        "STRUCT NOX/Printing": {
-            "Outer Iteration": True,
-            "Inner Iteration": False,
-            "Outer Iteration StatusTest": True,
-        },
-        "MATERIALS": [
-            {
-                "MAT": 1,
-                "MAT_ElastHyper": {
-                    "NUMMAT": 1,
-                    "MATIDS": 10,
-                    "DENS": 1,
-                },
-            },
-            {
-                "MAT": 10,
-                "ELAST_CoupLogNeoHooke": {
-                    "MODE": "YN",
-                    "C1": YOUNG,
-                    "C2": POISSON,
-                },
-            },
-        ],
-        "FUNCT1": [
-            {
-                "SYMBOLIC_FUNCTION_OF_SPACE_TIME": f"y*cos({2 * END_ROTATION / 360}*pi*t)-z*sin({2 * END_ROTATION / 360}*pi*t)-y"
-            },
-        ],
-        "FUNCT2": [
-            {
-                "SYMBOLIC_FUNCTION_OF_SPACE_TIME": f"y*sin({2 * END_ROTATION / 360}*pi*t)+z*cos({2 * END_ROTATION / 360}*pi*t)-z"
-            },
-        ],
-    })
+    cubit.fourc_input.combine_sections(INPUT_SECTIONS)
 
     # Write the input file.
     cubit.dump(filename)
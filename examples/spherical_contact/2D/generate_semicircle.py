@@ -1,6 +1,5 @@
 import os
 import numpy as np
-from cubitpy import CubitPy, cupy
 
 from femref.cubit_utils import print_mesh_statistics
 from femref.utils import write_readme
@@ -30,8 +29,6 @@ MESH_SIZE_COARSE = 0.1
 # intermediate mesh size
 # (in the middle of the semicircle, where the different blocks join)
 MESH_SIZE_INTERMEDIATE = 0.5 * (MESH_SIZE_COARSE + MESH_SIZE_CONTACT) / 2
-# tolerance for identifying BCs based on point coordinates
-EPS = 1e-5
 
 ##### MODEL ###################################################################
 # kinematics (relation between strains and displacements)
@@ -103,49 +100,66 @@ def generate_semicircle(filename: str) -> None:
         Name (and path) of the generated simulation input file.
     """
 
+    # import CubitPy only when it is actually needed, as loading the Cubit
+    # library is expensive
+    from cubitpy import CubitPy, cupy
+
     # Start the cubit session
     cubit = CubitPy()
 
     # iterate through all vertices clockwise, starting from the origin
-    cubit.cmd("create vertex 0 0 0")
-    cubit.cmd(f"create vertex {H_WIDTH} 0 0")
-    cubit.cmd(f"create vertex {RADIUS} 0 0")
-    cubit.cmd(f"create vertex {H_ARCLOC} {-H_ARCLOC} 0")
-    # cubit.cmd(f"create vertex 0 {-RADIUS} 0")
-    cubit.cmd(f"create vertex {-H_ARCLOC} {-H_ARCLOC} 0")
-    cubit.cmd(f"create vertex {-RADIUS} 0 0")
-    cubit.cmd(f"create vertex {-H_WIDTH} 0 0")
-    # add the additional interior helper vertices
-    cubit.cmd(f"create vertex {-0.75 * H_WIDTH} {-H_HEIGHT} 0")
-    cubit.cmd(f"create vertex {0.75 * H_WIDTH} {-H_HEIGHT} 0")
+    vertex_cmds = [
+        "create vertex 0 0 0",
+        f"create vertex {H_WIDTH} 0 0",
+        f"create vertex {RADIUS} 0 0",
+        f"create vertex {H_ARCLOC} {-H_ARCLOC} 0",
+        # f"create vertex 0 {-RADIUS} 0",
+        f"create vertex {-H_ARCLOC} {-H_ARCLOC} 0",
+        f"create vertex {-RADIUS} 0 0",
+        f"create vertex {-H_WIDTH} 0 0",
+        # add the additional interior helper vertices
+        f"create vertex {-0.75 * H_WIDTH} {-H_HEIGHT} 0",
+        f"create vertex {0.75 * H_WIDTH} {-H_HEIGHT} 0",
+    ]
+    cubit.cmd("\n".join(vertex_cmds))
+    # make sure that all batched commands were executed
+    assert cubit.get_last_id(cupy.geometry.vertex) == len(vertex_cmds)
 
     if SHOW_STEP[0]:
         cubit.display_in_cubit()
 
     # create the outline curves first
     # (IDs referring to vertices in order of creation)
-    cubit.cmd("create curve vertex 2 3")
-    cubit.cmd(f"create curve arc center vertex 1 3 4 radius {RADIUS}")
-    cubit.cmd(f"create curve arc center vertex 1 4 5 radius {RADIUS}")
-    cubit.cmd(f"create curve arc center vertex 1 5 6 radius {RADIUS}")
-    cubit.cmd("create curve vertex 6 7")
-    cubit.cmd("create curve vertex 7 2")
-    # then the internal ones
-    cubit.cmd("create curve vertex 4 9")
-    cubit.cmd("create curve vertex 9 2")
-    cubit.cmd("create curve vertex 5 8")
-    cubit.cmd("create curve vertex 8 7")
-    cubit.cmd("create curve vertex 8 9")
+    curve_cmds = [
+        "create curve vertex 2 3",
+        f"create curve arc center vertex 1 3 4 radius {RADIUS}",
+        f"create curve arc center vertex 1 4 5 radius {RADIUS}",
+        f"create curve arc center vertex 1 5 6 radius {RADIUS}",
+        "create curve vertex 6 7",
+        "create curve vertex 7 2",
+        # then the internal ones
+        "create curve vertex 4 9",
+        "create curve vertex 9 2",
+        "create curve vertex 5 8",
+        "create curve vertex 8 7",
+        "create curve vertex 8 9",
+    ]
+    cubit.cmd("\n".join(curve_cmds))
+    assert cubit.get_last_id(cupy.geometry.curve) == len(curve_cmds)
 
     if SHOW_STEP[1]:
         cubit.display_in_cubit()
 
     # create the surfaces from their bounding curves
     # (IDs referring to curves in order of creation)
-    cubit.cmd("create surface curve 1 2 7 8")
-    cubit.cmd("create surface curve 7 3 9 11")
-    cubit.cmd("create surface curve 10 9 4 5")
-    cubit.cmd("create surface curve 6 8 11 10")
+    surface_cmds = [
+        "create surface curve 1 2 7 8",
+        "create surface curve 7 3 9 11",
+        "create surface curve 10 9 4 5",
+        "create surface curve 6 8 11 10",
+    ]
+    cubit.cmd("\n".join(surface_cmds))
+    assert cubit.get_last_id(cupy.geometry.surface) == len(surface_cmds)
     # create group for semicircle
     cubit.group(add_value="add surface 1 2 3 4", name="semicircle")
 
@@ -171,22 +185,17 @@ def generate_semicircle(filename: str) -> None:
         cubit.display_in_cubit()
 
     # define the mesh granularity on the important curves that will allow us
-    # to refine where needed
-    cubit.cmd(
-        f"curve 8  scheme bias fine size {MESH_SIZE_INTERMEDIATE} coarse size {MESH_SIZE_COARSE} start vertex 9"
-    )
-    cubit.cmd(
-        f"curve 10 scheme bias fine size {MESH_SIZE_INTERMEDIATE} coarse size {MESH_SIZE_COARSE} start vertex 8"
-    )
-    cubit.cmd(
-        f"curve 7  scheme bias fine size {MESH_SIZE_CONTACT} coarse size {MESH_SIZE_INTERMEDIATE} start vertex 4"
-    )
-    cubit.cmd(
-        f"curve 9  scheme bias fine size {MESH_SIZE_CONTACT} coarse size {MESH_SIZE_INTERMEDIATE} start vertex 5"
-    )
-    cubit.cmd(
-        f"curve 3  scheme bias fine size {MESH_SIZE_CONTACT} factor 1.0 "
-    )
+    # to refine where needed (these commands do not create any entities, so
+    # they are issued one by one to not silently lose any of them)
+    mesh_size_cmds = [
+        f"curve 8  scheme bias fine size {MESH_SIZE_INTERMEDIATE} coarse size {MESH_SIZE_COARSE} start vertex 9",
+        f"curve 10 scheme bias fine size {MESH_SIZE_INTERMEDIATE} coarse size {MESH_SIZE_COARSE} start vertex 8",
+        f"curve 7  scheme bias fine size {MESH_SIZE_CONTACT} coarse size {MESH_SIZE_INTERMEDIATE} start vertex 4",
+        f"curve 9  scheme bias fine size {MESH_SIZE_CONTACT} coarse size {MESH_SIZE_INTERMEDIATE} start vertex 5",
+        f"curve 3  scheme bias fine size {MESH_SIZE_CONTACT} factor 1.0 ",
+    ]
+    for mesh_size_cmd in mesh_size_cmds:
+        cubit.cmd(mesh_size_cmd)
 
     # generate the mesh of the contact plane (one element is enough [Steinbrecher, 2024])
     cubit.cmd(f"surface {rigid_id} size {2 * RADIUS}")
@@ -198,10 +207,9 @@ def generate_semicircle(filename: str) -> None:
         cubit.display_in_cubit()
 
     # add the node sets for the boundary conditions
+    # (IDs referring to curves in order of creation)
     cubit.add_node_set(
-        cubit.group(
-            add_value=f"add curve with {-EPS} < y_coord and y_coord < {EPS}"
-        ),
+        cubit.group(add_value="add curve 1 5 6"),
         name="top_boundary_neumann",
         bc_type=cupy.bc_type.neumann,
         bc_description={
@@ -212,7 +220,7 @@ def generate_semicircle(filename: str) -> None:
         },
     )
     cubit.add_node_set(
-        cubit.group(add_value=f"add curve with y_coord < {-H_ARCLOC + EPS}"),
+        cubit.group(add_value=f"add curve 3 curve in surface {rigid_id}"),
         name="bottom_boundary_contact",
         bc_type=cupy.bc_type.solid_to_solid_curve_contact,
         bc_description={
@@ -1,6 +1,12 @@
-from typing import Dict, List, Optional, Union
+from __future__ import annotations
 
-from cubitpy import CubitPy
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from cubitpy import CubitPy
+
+# Entity types that can be tracked by `cubit_cmd`
+TRACKABLE_GEOMETRY_TYPES = ("vertex", "curve", "surface", "volume")
 
 
 def cubit_cmd(
@@ -18,7 +24,8 @@ def cubit_cmd(
     cubit : CubitPy
         The CubitPy instance to use for executing the command.
     track_id : str, optional
-        The type of entity to track (default is "volume").
+        The type of geometric entity to track (default is "volume"). Must be
+        one of "vertex", "curve", "surface" or "volume".
     flatten_if_possible : bool, optional
         If True and only one ID would be returned, the ID will be returned as a single value instead of as a list with one single entry.
 
@@ -26,15 +33,36 @@ def cubit_cmd(
     -------
     Union[List[int], int]
         A list of new IDs created by the command.
+
+    Raises
+    ------
+    ValueError
+        If `track_id` is not a trackable geometry type.
+
+    Notes
+    -----
+    The new IDs are determined from the last ID before and after the command,
+    i.e., they are assumed to be contiguous. IDs of entities that are created
+    and deleted again within the same command are still part of the result.
     """
-    # Step 1: Get current IDs of entities to be tracked
-    before_cmd = set(cubit.parse_cubit_list(track_id, "all"))
+    from cubitpy import cupy
+
+    if track_id not in TRACKABLE_GEOMETRY_TYPES:
+        raise ValueError(
+            f"Cannot track entities of type '{track_id}', expected one of "
+            f"{TRACKABLE_GEOMETRY_TYPES}."
+        )
+
+    # Step 1: Get the last ID of the entity type to be tracked
+    geometry_type = getattr(cupy.geometry, track_id)
+    before_cmd = cubit.get_last_id(geometry_type)
     # Step 2: Perform cubit command
     cubit.cmd(command)
-    # Step 3: Get IDs after the cubit command
-    after_cmd = set(cubit.parse_cubit_list(track_id, "all"))
-    # Step 4: New IDs are the difference
-    new_ids = list(after_cmd - before_cmd)
+    # Step 3: Get the last ID after the cubit command
+    after_cmd = cubit.get_last_id(geometry_type)
+    # Step 4: Cubit assigns increasing IDs, so the new IDs are the ones in
+    # between
+    new_ids = list(range(before_cmd + 1, after_cmd + 1))
     # If the list contains only one ID, return it as a single value
     if len(new_ids) == 1 and flatten_if_possible:
         return new_ids[0]
@@ -57,16 +85,21 @@ def print_mesh_statistics(
     options : Dict[str, Union[int, float, str]], optional
         A dictionary to store the resulting mesh statistics.
     """
-    # Print information about the total number of nodes and elements in the mesh
+    # Get the total number of nodes and elements in the mesh
     num_nodes = cubit.get_node_count()
     num_elements = cubit.get_element_count()
-    print(f"Total nodes:        {num_nodes}")
-    print(f"Total elements:     {num_elements}")
     # Also add the information to the options dictionary
     if options is not None:
         options["mesh"]["resulting_nodes"] = num_nodes
         options["mesh"]["resulting_elements"] = num_elements
-    # Print information about the number of nodes in each nodeset
+    # Collect all statistics first and print them at once
+    lines = [
+        f"Total nodes:        {num_nodes}",
+        f"Total elements:     {num_elements}",
+    ]
     nodeset_ids = cubit.parse_cubit_list("nodeset", "all")
-    for nsid in nodeset_ids:
-        print(f"Nodes in Nodeset {nsid}: {cubit.get_nodeset_node_count(nsid)}")
+    lines.extend(
+        f"Nodes in Nodeset {nsid}: {cubit.get_nodeset_node_count(nsid)}"
+        for nsid in nodeset_ids
+    )
+    print("\n".join(lines))
@@ -18,19 +18,22 @@ def write_readme(
     # ensure the filepath contains README.md
     if not filepath.endswith("README.md"):
         filepath = f"{filepath}/README.md"
-    # create and open th README file
+    # collect the README content, starting with the header
+    parts = [
+        f"# {options['title']}\n\n",
+        f"{options['description']}\n\n\n",
+    ]
+    # add the parameters
+    for key, value in options.items():
+        if hasattr(value, "items"):
+            parts.extend([
+                f"## {key}\n",
+                "| Parameter | Value |\n|:--|:--|\n",
+                *(f"| {param} | {val} |\n" for param, val in value.items()),
+                "\n\n",
+            ])
+    timestamp = datetime.datetime.now().strftime("%B %d, %Y at %I:%M%p ")
+    parts.append(f"Last updated: {timestamp}\n")
+    # create the README file and write the content at once
     with open(filepath, "w") as f:
-        # write the header
-        f.write(f"# {options['title']}\n\n")
-        f.write(f"{options['description']}\n\n\n")
-        # write the parameters
-        for key, value in options.items():
-            if hasattr(value, "items"):
-                f.write(f"## {key}\n")
-                f.write("| Parameter | Value |\n|:--|:--|\n")
-                for param, val in value.items():
-                    f.write(f"| {param} | {val} |\n")
-                f.write("\n\n")
-        f.write(
-            f"Last updated: {datetime.datetime.now().strftime('%B %d, %Y at %I:%M%p ')}\n"
-        )
+        f.writelines(parts)